@@ -14,10 +14,283 @@ Environment Variables:
 - ALBERT_API_KEY: API key for authentication
 """
 
+from __future__ import annotations
+
+import asyncio
+import functools
+import mimetypes
+import operator
 import os
-import httpx
-import json
+import random
+import threading
+import time
+import orjson
+from cachetools import TTLCache, cachedmethod
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterator
+
+from llm_cache import cached_call
+
+if TYPE_CHECKING:
+    import httpx
+
+# httpx and ijson are imported lazily inside the methods that use them:
+# importing this module stays cheap for cold-start-sensitive callers
+# (CLI tools, serverless) that may not issue a request at all
+
+# Fixed endpoint paths, interned once at import instead of per call
+_MODELS_ENDPOINT = "/v1/models"
+_CHAT_COMPLETIONS_ENDPOINT = "/v1/chat/completions"
+_AGENTS_COMPLETIONS_ENDPOINT = "/v1/agents/completions"
+_AGENTS_TOOLS_ENDPOINT = "/v1/agents/tools"
+_EMBEDDINGS_ENDPOINT = "/v1/embeddings"
+_AUDIO_TRANSCRIPTIONS_ENDPOINT = "/v1/audio/transcriptions"
+_PARSE_ENDPOINT = "/v1/parse-beta"
+_OCR_ENDPOINT = "/v1/ocr-beta"
+_COLLECTIONS_ENDPOINT = "/v1/collections"
+_DOCUMENTS_ENDPOINT = "/v1/documents"
+_SEARCH_ENDPOINT = "/v1/search"
+_RERANK_ENDPOINT = "/v1/rerank"
+_USAGE_ENDPOINT = "/v1/usage"
+_TOKENS_ENDPOINT = "/tokens"
+
+# Prefixes for per-id paths; plain concatenation onto a prebuilt prefix is
+# cheaper than re-formatting the whole template on every call
+_MODEL_PREFIX = _MODELS_ENDPOINT + "/"
+_COLLECTION_PREFIX = _COLLECTIONS_ENDPOINT + "/"
+_DOCUMENT_PREFIX = _DOCUMENTS_ENDPOINT + "/"
+_CHUNKS_PREFIX = "/v1/chunks/"
+_TOKEN_PREFIX = _TOKENS_ENDPOINT + "/"
+
+# Statuses worth retrying: rate limiting and transient upstream failures
+_RETRY_STATUS_CODES = (429, 502, 503, 504)
+_MAX_RETRIES = 3
+_BACKOFF_BASE = 0.5
+_BACKOFF_CAP = 8.0
+_BACKOFF_JITTER = 0.25
+
+
+def _retry_delay(attempt: int, retry_after: str | None) -> float:
+    """Honor a Retry-After header when present, else jittered exponential backoff."""
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return min(_BACKOFF_CAP, _BACKOFF_BASE * 2**attempt) + random.random() * _BACKOFF_JITTER
+
+
+# One process-wide client shared by AlbertAPI(share_client=True) instances,
+# handed out by refcount so its pooled HTTP/2 connections outlive any single
+# instance (useful in notebooks and web backends that build a client per call)
+_shared_client: httpx.Client | None = None
+_shared_client_config: tuple | None = None
+_shared_client_refs = 0
+_shared_client_lock = threading.Lock()
+
+
+def _acquire_shared_client(config: tuple, build: Callable) -> httpx.Client | None:
+    """Get (or create) the shared client; None if the config doesn't match."""
+    global _shared_client, _shared_client_config, _shared_client_refs
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client.is_closed:
+            _shared_client = build()
+            _shared_client_config = config
+            _shared_client_refs = 0
+        elif _shared_client_config != config:
+            return None
+        _shared_client_refs += 1
+        return _shared_client
+
+
+def _release_shared_client() -> None:
+    """Drop one reference; the client only really closes at zero."""
+    global _shared_client, _shared_client_refs
+    with _shared_client_lock:
+        _shared_client_refs -= 1
+        if _shared_client_refs <= 0 and _shared_client is not None:
+            _shared_client.close()
+            _shared_client = None
+
+
+class _TokenBucket:
+    """Token-bucket rate limiter usable from sync and async code."""
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        """
+        Args:
+            rate: Sustained request rate, in requests per second
+            burst: Extra capacity absorbed before throttling (defaults to rate)
+        """
+        self.rate = float(rate)
+        self.capacity = float(burst) if burst is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def _limiter_from_headers(headers) -> _TokenBucket | None:
+    """Seed a limiter from an X-RateLimit-Limit header (per-minute window)."""
+    limit = headers.get("X-RateLimit-Limit")
+    if not limit:
+        return None
+    try:
+        per_minute = int(limit)
+    except ValueError:
+        return None
+    return _TokenBucket(per_minute / 60.0)
+
+
+def _singleflight_key(endpoint: str, kwargs: dict) -> tuple:
+    """Build the dedup key for an idempotent GET."""
+    params = kwargs.get("params")
+    return (endpoint, tuple(sorted(params.items())) if params else ())
+
+
+class _Flight:
+    """Outcome slot shared between the owner of a request and its waiters."""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: dict | None = None
+        self.error: BaseException | None = None
+
+
+class _ByteStream:
+    """Minimal file-like adapter feeding an iterator of bytes to ijson."""
+
+    def __init__(self, iterator: Iterator[bytes]) -> None:
+        self._iterator = iterator
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            try:
+                self._buffer += next(self._iterator)
+            except StopIteration:
+                break
+        if size < 0:
+            chunk, self._buffer = self._buffer, b""
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+def _encode_json(kwargs: dict) -> dict:
+    """Serialize a ``json=`` request body with orjson instead of stdlib json.
+
+    orjson encodes (and decodes) typical API payloads several times faster
+    than the stdlib module, which matters most on embedding-sized bodies.
+    """
+    if "json" in kwargs:
+        kwargs["content"] = orjson.dumps(
+            kwargs.pop("json"), option=orjson.OPT_SERIALIZE_NUMPY
+        )
+        headers = kwargs.setdefault("headers", {})
+        headers.setdefault("Content-Type", "application/json")
+    return kwargs
+
+
+def _sse_delta_content(line: str) -> str | None:
+    """
+    Extract the delta content from one SSE frame line, if it carries any.
+
+    Args:
+        line: Raw line from a ``text/event-stream`` response
+
+    Returns:
+        Content fragment, or None for comments, [DONE] and empty deltas
+    """
+    if not line.startswith("data: "):
+        return None
+    payload = line[6:].strip()
+    if not payload or payload == "[DONE]":
+        return None
+    try:
+        event = orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        return None
+    choices = event.get("choices") or []
+    if not choices:
+        return None
+    return (choices[0].get("delta") or {}).get("content")
+
+
+def _decode_embeddings(response: dict) -> dict:
+    """
+    Decode base64-encoded embeddings into NumPy float32 arrays in place.
+
+    Args:
+        response: Embeddings response, possibly with base64 string vectors
+
+    Returns:
+        The response, with string embeddings replaced by contiguous arrays
+    """
+    import base64
+
+    import numpy as np
+
+    for item in response.get("data") or []:
+        embedding = item.get("embedding")
+        if isinstance(embedding, str):
+            item["embedding"] = np.frombuffer(
+                base64.b64decode(embedding), dtype=np.float32
+            )
+    return response
+
+
+def _with_decoded_embeddings(func):
+    """Decode embeddings after the response cache, so the cache keeps the
+    compact base64 form and hits decode the same way as misses."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        return _decode_embeddings(func(self, *args, **kwargs))
+
+    return wrapper
+
+
+def _meta_key(name: str):
+    """Build a cache key function that namespaces entries by method name."""
+
+    def key(self, *args, **kwargs):
+        return (name, args, frozenset(kwargs.items()))
+
+    return key
+
+
+def _cached_meta(name: str):
+    """Decorator caching an idempotent GET in the per-instance TTL cache."""
+    return cachedmethod(
+        operator.attrgetter("_meta_cache"),
+        key=_meta_key(name),
+        lock=operator.attrgetter("_meta_cache_lock"),
+    )
 
 
 class AlbertAPI:
@@ -40,7 +313,11 @@ class AlbertAPI:
     """
 
     def __init__(
-        self, base_url: str | None = None, api_key: str | None = None, timeout: int = 30
+        self,
+        base_url: str | None = None,
+        api_key: str | None = None,
+        timeout: int = 30,
+        share_client: bool = False,
     ) -> None:
         """
         Initialize the Albert API client.
@@ -49,8 +326,13 @@ class AlbertAPI:
             base_url: Base URL for the API (defaults to ALBERT_API_BASE_URL env var)
             api_key: API key for authentication (defaults to ALBERT_API_KEY env var)
             timeout: Request timeout in seconds
+            share_client: Reuse one process-wide httpx client across instances
+                with the same configuration, so each new instance keeps the
+                already-warm connection pool instead of handshaking again
         """
-        self.base_url = base_url or os.getenv("ALBERT_API_BASE_URL")
+        self.base_url = (base_url or os.getenv("ALBERT_API_BASE_URL") or "").rstrip(
+            "/"
+        )
         self.api_key = api_key or os.getenv("ALBERT_API_KEY")
         self.timeout = timeout
 
@@ -63,18 +345,78 @@ class AlbertAPI:
                 "API key is required. Set ALBERT_API_KEY environment variable or pass api_key parameter."
             )
 
-        self.session = httpx.Client()
-        self.session.headers.update(
-            {
+        # Metadata endpoints (models, tools, single collections/documents)
+        # change rarely; cache them so repeat lookups skip the round-trip.
+        # TTLCache is not thread-safe, so reads and writes go through a lock
+        self._meta_cache: TTLCache = TTLCache(maxsize=512, ttl=300)
+        self._meta_cache_lock = threading.Lock()
+
+        # Counts of retried responses, keyed by status code
+        self.retry_stats: Counter = Counter()
+
+        # Request counters for tuning pool limits and concurrency:
+        # requests, errors, rate_limited, inflight and max_inflight
+        self.stats: Counter = Counter()
+
+        # Token-bucket limiter, seeded from the server's X-RateLimit-Limit
+        # header on the first response (or set directly by the caller)
+        self.limiter: _TokenBucket | None = None
+
+        # Single-flight bookkeeping for concurrent identical GETs
+        self._inflight: dict[tuple, _Flight] = {}
+        self._inflight_lock = threading.Lock()
+
+        self._shared = False
+        if share_client:
+            config = (self.base_url, self.api_key, self.timeout)
+            shared = _acquire_shared_client(config, self._build_session)
+            if shared is not None:
+                self.session = shared
+                self._shared = True
+                return
+            # Differently-configured instances fall back to a private client
+
+        self.session = self._build_session()
+
+    def _build_session(self) -> httpx.Client:
+        """
+        Build the underlying httpx client.
+
+        A single HTTP/2 client: all endpoints live on one host, so requests
+        multiplex over one persistent connection instead of paying a TCP+TLS
+        handshake each time, and the static headers are HPACK-compressed.
+        The transport also retries failed connection attempts.
+        """
+        import httpx
+
+        return httpx.Client(
+            base_url=self.base_url,
+            headers={
                 "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            }
+                # zstd beats gzip on JSON bodies; httpx decodes it via the
+                # zstandard package
+                "Accept-Encoding": "zstd, gzip",
+            },
+            timeout=httpx.Timeout(self.timeout, connect=5.0),
+            transport=httpx.HTTPTransport(
+                retries=_MAX_RETRIES,
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=30.0,
+                ),
+            ),
         )
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> dict:
         """
         Make a request to the Albert API.
 
+        Identical GETs issued concurrently from several threads are collapsed
+        into a single outstanding request whose result is shared (the TTL cache
+        only covers completed requests, not the in-flight window).
+
         Args:
             method: HTTP method
             endpoint: API endpoint
@@ -86,29 +428,192 @@ class AlbertAPI:
         Raises:
             RuntimeError: If the request fails
         """
-        url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        if method != "GET":
+            return self._do_request(method, endpoint, **kwargs)
+
+        key = _singleflight_key(endpoint, kwargs)
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            if flight is None:
+                flight = _Flight()
+                self._inflight[key] = flight
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
 
         try:
-            response = self.session.request(
-                method=method, url=url, timeout=self.timeout, **kwargs
-            )
+            flight.result = self._do_request(method, endpoint, **kwargs)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+
+    def _do_request(self, method: str, endpoint: str, **kwargs) -> dict:
+        """Issue one request, with retries, and decode the response."""
+        import httpx
+
+        try:
+            kwargs = _encode_json(kwargs)
+            # File uploads cannot be replayed once the handle has been read
+            retries = 0 if "files" in kwargs else _MAX_RETRIES
+            for attempt in range(retries + 1):
+                if self.limiter is not None:
+                    self.limiter.acquire()
+                self.stats["requests"] += 1
+                self.stats["inflight"] += 1
+                self.stats["max_inflight"] = max(
+                    self.stats["max_inflight"], self.stats["inflight"]
+                )
+                try:
+                    response = self.session.request(
+                        method=method, url=endpoint, **kwargs
+                    )
+                finally:
+                    self.stats["inflight"] -= 1
+                if self.limiter is None:
+                    self.limiter = _limiter_from_headers(response.headers)
+                if response.status_code == 429:
+                    self.stats["rate_limited"] += 1
+                if response.status_code not in _RETRY_STATUS_CODES or attempt == retries:
+                    break
+                self.retry_stats[response.status_code] += 1
+                time.sleep(
+                    _retry_delay(attempt, response.headers.get("Retry-After"))
+                )
+            if response.status_code >= 400:
+                self.stats["errors"] += 1
             response.raise_for_status()
 
             # Handle empty responses
             if response.status_code == 204:
                 return {}
 
-            return response.json()
+            return orjson.loads(response.content)
 
         except httpx.HTTPError as e:
             raise RuntimeError(f"API request failed: {e}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse JSON response: {e}")
 
+    def _make_request_stream(
+        self, method: str, endpoint: str, prefix: str = "data.item", **kwargs
+    ) -> Iterator:
+        """
+        Make a request and incrementally parse the response body.
+
+        Items are yielded as soon as they are decoded, so callers can start
+        consuming before the server finishes and peak memory stays bounded by
+        one item instead of the whole body.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            prefix: ijson prefix of the items to yield (default: ``data`` array)
+            **kwargs: Additional request parameters
+
+        Yields:
+            Parsed items under the given prefix
+
+        Raises:
+            RuntimeError: If the request fails
+        """
+        import httpx
+        import ijson
+
+        try:
+            with self.session.stream(
+                method, endpoint, **_encode_json(kwargs)
+            ) as response:
+                response.raise_for_status()
+                yield from ijson.items(_ByteStream(response.iter_bytes()), prefix)
+
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"API request failed: {e}")
+        except ijson.JSONError as e:
+            raise RuntimeError(f"Failed to parse JSON response: {e}")
+
+    def _upload(
+        self, endpoint: str, file_path: str | Path, media_type: str, data: dict,
+        kind: str = "File",
+    ) -> dict:
+        """
+        Upload a file as a multipart form request.
+
+        The open file handle is handed to httpx, which streams the multipart
+        body in chunks instead of buffering the whole file in memory, so large
+        uploads keep a flat memory profile and bytes hit the wire immediately.
+
+        Args:
+            endpoint: API endpoint
+            file_path: Path to the file to upload
+            media_type: Fallback MIME type when it cannot be guessed from the
+                file name
+            data: Additional form fields
+            kind: Label used in the not-found error message
+
+        Returns:
+            API response as dictionary
+        """
+        # Plain os.path calls skip Path object construction in bulk-ingest
+        # loops, and guessing the MIME type keeps WAV/DOCX and friends from
+        # being mislabeled with the per-endpoint default
+        path_str = str(file_path)
+
+        if not os.path.isfile(path_str):
+            raise FileNotFoundError(f"{kind} not found: {path_str}")
+
+        name = os.path.basename(path_str)
+        media_type = mimetypes.guess_type(name)[0] or media_type
+
+        with open(path_str, "rb") as f:
+            files = {"file": (name, f, media_type)}
+            return self._make_request("POST", endpoint, data=data, files=files)
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached metadata so the next GETs hit the API again."""
+        with self._meta_cache_lock:
+            self._meta_cache.clear()
+
+    def _iter_pages(
+        self, fetch: Callable[[int, int], dict], limit: int
+    ) -> Iterator[dict]:
+        """
+        Iterate items across pages, prefetching the next page in the background.
+
+        While the caller consumes page N, page N+1 is already being fetched in
+        a worker thread, so server latency hides behind client processing.
+        Iteration stops on the first short page.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            future = executor.submit(fetch, offset, limit)
+            while True:
+                page = future.result()
+                items = page.get("data", [])
+                if len(items) == limit:
+                    offset += limit
+                    future = executor.submit(fetch, offset, limit)
+                else:
+                    future = None
+                yield from items
+                if future is None:
+                    break
+
     # ============================================================================
     # MODELS
     # ============================================================================
 
+    @_cached_meta("get_models")
     def get_models(self) -> dict:
         """
         Get list of available models.
@@ -118,8 +623,9 @@ class AlbertAPI:
             includes ``id``, ``type``, and an ``aliases`` list of short product names
             accepted by the API (e.g. ``openweight-small``) alongside the technical id.
         """
-        return self._make_request("GET", "/v1/models")
+        return self._make_request("GET", _MODELS_ENDPOINT)
 
+    @_cached_meta("get_model")
     def get_model(self, model: str) -> dict:
         """
         Get information about a specific model.
@@ -130,10 +636,12 @@ class AlbertAPI:
         Returns:
             Model information
         """
-        return self._make_request("GET", f"/v1/models/{model}")
+        return self._make_request("GET", _MODEL_PREFIX + model)
 
     def get_models_ids(self) -> list[str]:
         """Get the list of the official names for all the available Albert models."""
+        # Not cached itself: get_models already is, and caching here would
+        # pin the empty-list failure fallback for the whole TTL
         try:
             models = self.get_models()
             return [m["id"] for m in models.get("data", [])]
@@ -145,6 +653,7 @@ class AlbertAPI:
     # CHAT COMPLETIONS
     # ============================================================================
 
+    @cached_call("messages")
     def chat_completions(self, messages: list[dict], model: str, **kwargs) -> dict:
         """
         Create a chat completion.
@@ -157,8 +666,77 @@ class AlbertAPI:
         Returns:
             Chat completion response
         """
-        data = {"messages": messages, "model": model, **kwargs}
-        return self._make_request("POST", "/v1/chat/completions", json=data)
+        kwargs["messages"] = messages
+        kwargs["model"] = model
+        return self._make_request("POST", _CHAT_COMPLETIONS_ENDPOINT, json=kwargs)
+
+    def chat_completions_batch(
+        self,
+        list_of_messages: list[list[dict]],
+        model: str,
+        concurrency: int = 8,
+        **kwargs,
+    ) -> list[dict]:
+        """
+        Run many chat completions concurrently over a thread pool.
+
+        Args:
+            list_of_messages: One message list per completion
+            model: Model to use for all completions
+            concurrency: Maximum number of completions in flight
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            Chat completion responses, aligned with ``list_of_messages``
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(
+                executor.map(
+                    lambda messages: self.chat_completions(
+                        messages, model, **dict(kwargs)
+                    ),
+                    list_of_messages,
+                )
+            )
+
+    def chat_completions_stream(
+        self, messages: list[dict], model: str, **kwargs
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion, yielding content fragments as they arrive.
+
+        The first fragment shows up at first-token latency instead of after
+        the whole completion has been generated, so callers can start
+        printing or processing immediately.
+
+        Args:
+            messages: List of message dictionaries
+            model: Model to use for completion
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Yields:
+            Content fragments from the completion deltas
+
+        Raises:
+            RuntimeError: If the request fails
+        """
+        import httpx
+
+        kwargs["messages"] = messages
+        kwargs["model"] = model
+        kwargs["stream"] = True
+        try:
+            with self.session.stream(
+                "POST", _CHAT_COMPLETIONS_ENDPOINT, **_encode_json({"json": kwargs})
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    content = _sse_delta_content(line)
+                    if content:
+                        yield content
+
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"API request failed: {e}")
 
     def agents_completions(self, messages: list[dict], model: str, **kwargs) -> dict:
         """
@@ -172,9 +750,11 @@ class AlbertAPI:
         Returns:
             Agent completion response
         """
-        data = {"messages": messages, "model": model, **kwargs}
-        return self._make_request("POST", "/v1/agents/completions", json=data)
+        kwargs["messages"] = messages
+        kwargs["model"] = model
+        return self._make_request("POST", _AGENTS_COMPLETIONS_ENDPOINT, json=kwargs)
 
+    @_cached_meta("get_agents_tools")
     def get_agents_tools(self) -> dict:
         """
         Get available tools for agents.
@@ -182,28 +762,36 @@ class AlbertAPI:
         Returns:
             Available tools
         """
-        return self._make_request("GET", "/v1/agents/tools")
+        return self._make_request("GET", _AGENTS_TOOLS_ENDPOINT)
 
     # ============================================================================
     # EMBEDDINGS
     # ============================================================================
 
+    @_with_decoded_embeddings
+    @cached_call("input_text")
     def create_embeddings(
         self, input_text: str | list[str], model: str, **kwargs
     ) -> dict:
         """
         Create embeddings for text.
 
+        Vectors are requested in base64/float32 form (about 4x smaller on
+        the wire than JSON float lists) and come back as NumPy float32
+        arrays. Pass encoding_format="float" for plain lists.
+
         Args:
             input_text: Text or list of texts to embed
             model: Embedding model to use
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (encoding_format, etc.)
 
         Returns:
             Embeddings response
         """
-        data = {"input": input_text, "model": model, **kwargs}
-        return self._make_request("POST", "/v1/embeddings", json=data)
+        kwargs["input"] = input_text
+        kwargs["model"] = model
+        kwargs.setdefault("encoding_format", "base64")
+        return self._make_request("POST", _EMBEDDINGS_ENDPOINT, json=kwargs)
 
     # ============================================================================
     # AUDIO TRANSCRIPTION
@@ -221,18 +809,11 @@ class AlbertAPI:
         Returns:
             Transcription response
         """
-        file_path = Path(file_path)
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {file_path}")
-
-        data = {"model": model, **kwargs}
-
-        with open(file_path, "rb") as f:
-            files = {"file": (file_path.name, f, "audio/mpeg")}
-            return self._make_request(
-                "POST", "/v1/audio/transcriptions", data=data, files=files
-            )
+        kwargs["model"] = model
+        return self._upload(
+            _AUDIO_TRANSCRIPTIONS_ENDPOINT, file_path, "audio/mpeg", kwargs,
+            kind="Audio file",
+        )
 
     # ============================================================================
     # DOCUMENT PROCESSING
@@ -249,16 +830,10 @@ class AlbertAPI:
         Returns:
             Parsed document response
         """
-        file_path = Path(file_path)
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"Document file not found: {file_path}")
-
-        data = kwargs
-
-        with open(file_path, "rb") as f:
-            files = {"file": (file_path.name, f, "application/pdf")}
-            return self._make_request("POST", "/v1/parse-beta", data=data, files=files)
+        return self._upload(
+            _PARSE_ENDPOINT, file_path, "application/pdf", kwargs,
+            kind="Document file",
+        )
 
     def ocr_document(self, file_path: str | Path, model: str, **kwargs) -> dict:
         """
@@ -272,16 +847,10 @@ class AlbertAPI:
         Returns:
             OCR response
         """
-        file_path = Path(file_path)
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"PDF file not found: {file_path}")
-
-        data = {"model": model, **kwargs}
-
-        with open(file_path, "rb") as f:
-            files = {"file": (file_path.name, f, "application/pdf")}
-            return self._make_request("POST", "/v1/ocr-beta", data=data, files=files)
+        kwargs["model"] = model
+        return self._upload(
+            _OCR_ENDPOINT, file_path, "application/pdf", kwargs, kind="PDF file"
+        )
 
     # ============================================================================
     # COLLECTIONS AND DOCUMENTS
@@ -302,7 +871,8 @@ class AlbertAPI:
             Created collection response
         """
         data = {"name": name, "description": description, "visibility": visibility}
-        return self._make_request("POST", "/v1/collections", json=data)
+        self.invalidate_cache()
+        return self._make_request("POST", _COLLECTIONS_ENDPOINT, json=data)
 
     def get_collections(self, offset: int = 0, limit: int = 10) -> dict:
         """
@@ -316,8 +886,24 @@ class AlbertAPI:
             Collections list
         """
         params = {"offset": offset, "limit": limit}
-        return self._make_request("GET", "/v1/collections", params=params)
+        return self._make_request("GET", _COLLECTIONS_ENDPOINT, params=params)
+
+    def iter_collections(self, limit: int = 10) -> Iterator[dict]:
+        """
+        Iterate over all collections, fetching pages as needed.
+
+        Args:
+            limit: Page size used for the underlying requests
+
+        Yields:
+            Collection dictionaries
+        """
+        return self._iter_pages(
+            lambda offset, limit: self.get_collections(offset=offset, limit=limit),
+            limit,
+        )
 
+    @_cached_meta("get_collection")
     def get_collection(self, collection_id: int) -> dict:
         """
         Get collection by ID.
@@ -328,7 +914,7 @@ class AlbertAPI:
         Returns:
             Collection information
         """
-        return self._make_request("GET", f"/v1/collections/{collection_id}")
+        return self._make_request("GET", _COLLECTION_PREFIX + str(collection_id))
 
     def update_collection(self, collection_id: int, **kwargs) -> None:
         """
@@ -338,7 +924,8 @@ class AlbertAPI:
             collection_id: Collection ID
             **kwargs: Fields to update (name, description, visibility)
         """
-        self._make_request("PATCH", f"/v1/collections/{collection_id}", json=kwargs)
+        self.invalidate_cache()
+        self._make_request("PATCH", _COLLECTION_PREFIX + str(collection_id), json=kwargs)
 
     def delete_collection(self, collection_id: int) -> None:
         """
@@ -347,7 +934,8 @@ class AlbertAPI:
         Args:
             collection_id: Collection ID
         """
-        self._make_request("DELETE", f"/v1/collections/{collection_id}")
+        self.invalidate_cache()
+        self._make_request("DELETE", _COLLECTION_PREFIX + str(collection_id))
 
     def create_document(
         self, file_path: str | Path, collection_id: int, **kwargs
@@ -363,16 +951,12 @@ class AlbertAPI:
         Returns:
             Created document response
         """
-        file_path = Path(file_path)
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"Document file not found: {file_path}")
-
-        data = {"collection": collection_id, **kwargs}
-
-        with open(file_path, "rb") as f:
-            files = {"file": (file_path.name, f, "application/pdf")}
-            return self._make_request("POST", "/v1/documents", data=data, files=files)
+        self.invalidate_cache()
+        kwargs["collection"] = collection_id
+        return self._upload(
+            _DOCUMENTS_ENDPOINT, file_path, "application/pdf", kwargs,
+            kind="Document file",
+        )
 
     def get_documents(
         self, collection_id: int | None = None, limit: int = 10, offset: int = 0
@@ -392,8 +976,29 @@ class AlbertAPI:
         if collection_id is not None:
             params["collection"] = collection_id
 
-        return self._make_request("GET", "/v1/documents", params=params)
+        return self._make_request("GET", _DOCUMENTS_ENDPOINT, params=params)
+
+    def iter_documents(
+        self, collection_id: int | None = None, limit: int = 10
+    ) -> Iterator[dict]:
+        """
+        Iterate over all documents, fetching pages as needed.
+
+        Args:
+            collection_id: Collection ID (optional, to filter by collection)
+            limit: Page size used for the underlying requests
+
+        Yields:
+            Document dictionaries
+        """
+        return self._iter_pages(
+            lambda offset, limit: self.get_documents(
+                collection_id, limit=limit, offset=offset
+            ),
+            limit,
+        )
 
+    @_cached_meta("get_document")
     def get_document(self, document_id: int) -> dict:
         """
         Get document by ID.
@@ -404,7 +1009,7 @@ class AlbertAPI:
         Returns:
             Document information
         """
-        return self._make_request("GET", f"/v1/documents/{document_id}")
+        return self._make_request("GET", _DOCUMENT_PREFIX + str(document_id))
 
     def delete_document(self, document_id: int) -> None:
         """
@@ -413,7 +1018,8 @@ class AlbertAPI:
         Args:
             document_id: Document ID
         """
-        self._make_request("DELETE", f"/v1/documents/{document_id}")
+        self.invalidate_cache()
+        self._make_request("DELETE", _DOCUMENT_PREFIX + str(document_id))
 
     # ============================================================================
     # CHUNKS
@@ -432,7 +1038,47 @@ class AlbertAPI:
             Chunks list
         """
         params = {"limit": limit, "offset": offset}
-        return self._make_request("GET", f"/v1/chunks/{document_id}", params=params)
+        return self._make_request("GET", _CHUNKS_PREFIX + str(document_id), params=params)
+
+    def get_chunks_iter(
+        self, document_id: int, limit: int = 10, offset: int = 0
+    ) -> Iterator[dict]:
+        """
+        Stream chunks of a document one by one.
+
+        Unlike :meth:`get_chunks`, the response body is parsed incrementally,
+        so large chunk listings never sit in memory all at once.
+
+        Args:
+            document_id: Document ID
+            limit: Number of chunks to return
+            offset: Pagination offset
+
+        Yields:
+            Chunk dictionaries
+        """
+        params = {"limit": limit, "offset": offset}
+        return self._make_request_stream(
+            "GET", _CHUNKS_PREFIX + str(document_id), params=params
+        )
+
+    def iter_chunks(self, document_id: int, limit: int = 10) -> Iterator[dict]:
+        """
+        Iterate over all chunks of a document, fetching pages as needed.
+
+        Args:
+            document_id: Document ID
+            limit: Page size used for the underlying requests
+
+        Yields:
+            Chunk dictionaries
+        """
+        return self._iter_pages(
+            lambda offset, limit: self.get_chunks(
+                document_id, limit=limit, offset=offset
+            ),
+            limit,
+        )
 
     def get_chunk(self, document_id: int, chunk_id: int) -> dict:
         """
@@ -445,7 +1091,7 @@ class AlbertAPI:
         Returns:
             Chunk information
         """
-        return self._make_request("GET", f"/v1/chunks/{document_id}/{chunk_id}")
+        return self._make_request("GET", _CHUNKS_PREFIX + str(document_id) + "/" + str(chunk_id))
 
     # ============================================================================
     # SEARCH
@@ -465,8 +1111,57 @@ class AlbertAPI:
         Returns:
             Search results
         """
-        data = {"prompt": prompt, "collections": collections or [], **kwargs}
-        return self._make_request("POST", "/v1/search", json=data)
+        kwargs["prompt"] = prompt
+        kwargs["collections"] = collections or []
+        return self._make_request("POST", _SEARCH_ENDPOINT, json=kwargs)
+
+    def search_iter(
+        self, prompt: str, collections: list[int] | None = None, **kwargs
+    ) -> Iterator[dict]:
+        """
+        Search for relevant chunks, streaming results one by one.
+
+        Unlike :meth:`search`, the response body is parsed incrementally, so
+        large result sets never sit in memory all at once.
+
+        Args:
+            prompt: Search query
+            collections: List of collection IDs to search in
+            **kwargs: Additional parameters (method, k, score_threshold, etc.)
+
+        Yields:
+            Search result dictionaries
+        """
+        kwargs["prompt"] = prompt
+        kwargs["collections"] = collections or []
+        return self._make_request_stream("POST", _SEARCH_ENDPOINT, json=kwargs)
+
+    def search_many(
+        self,
+        prompts: list[str],
+        collections: list[int] | None = None,
+        concurrency: int = 16,
+        **kwargs,
+    ) -> list[dict]:
+        """
+        Run many searches concurrently over a thread pool.
+
+        Args:
+            prompts: Search queries
+            collections: List of collection IDs to search in
+            concurrency: Maximum number of searches in flight
+            **kwargs: Additional parameters (method, k, score_threshold, etc.)
+
+        Returns:
+            Search results, aligned with ``prompts``
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(
+                executor.map(
+                    lambda prompt: self.search(prompt, collections, **kwargs),
+                    prompts,
+                )
+            )
 
     # ============================================================================
     # RERANK
@@ -485,7 +1180,7 @@ class AlbertAPI:
             Reranking results
         """
         data = {"prompt": prompt, "input": input_texts, "model": model}
-        return self._make_request("POST", "/v1/rerank", json=data)
+        return self._make_request("POST", _RERANK_ENDPOINT, json=data)
 
     # ============================================================================
     # USAGE
@@ -503,8 +1198,9 @@ class AlbertAPI:
         Returns:
             Usage information
         """
-        params = {"limit": limit, "page": page, **kwargs}
-        return self._make_request("GET", "/v1/usage", params=params)
+        kwargs["limit"] = limit
+        kwargs["page"] = page
+        return self._make_request("GET", _USAGE_ENDPOINT, params=kwargs)
 
     # ============================================================================
     # TOKEN MANAGEMENT
@@ -530,7 +1226,7 @@ class AlbertAPI:
         if expires_at is not None:
             data["expires_at"] = expires_at
 
-        return self._make_request("POST", "/tokens", json=data)
+        return self._make_request("POST", _TOKENS_ENDPOINT, json=data)
 
     def get_tokens(self, offset: int = 0, limit: int = 10, **kwargs) -> dict:
         """
@@ -544,8 +1240,9 @@ class AlbertAPI:
         Returns:
             Tokens list
         """
-        params = {"offset": offset, "limit": limit, **kwargs}
-        return self._make_request("GET", "/tokens", params=params)
+        kwargs["offset"] = offset
+        kwargs["limit"] = limit
+        return self._make_request("GET", _TOKENS_ENDPOINT, params=kwargs)
 
     def get_token(self, token_id: int) -> dict:
         """
@@ -557,7 +1254,7 @@ class AlbertAPI:
         Returns:
             Token information
         """
-        return self._make_request("GET", f"/tokens/{token_id}")
+        return self._make_request("GET", _TOKEN_PREFIX + str(token_id))
 
     def delete_token(self, token_id: int) -> None:
         """
@@ -566,14 +1263,1063 @@ class AlbertAPI:
         Args:
             token_id: Token ID
         """
-        self._make_request("DELETE", f"/tokens/{token_id}")
+        self._make_request("DELETE", _TOKEN_PREFIX + str(token_id))
 
     def close(self) -> None:
-        """Close the session."""
-        self.session.close()
+        """Close the session (a shared session closes once all users have)."""
+        self.invalidate_cache()
+        if self._shared:
+            _release_shared_client()
+        else:
+            self.session.close()
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class AsyncAlbertAPI:
+    """
+    Asynchronous Albert API Client
+
+    Mirror of :class:`AlbertAPI` built on ``httpx.AsyncClient``. Every method is a
+    coroutine, so independent calls can be overlapped with ``asyncio.gather`` and
+    multiplexed over a single HTTP/2 connection:
+
+        async with AsyncAlbertAPI() as api:
+            responses = await asyncio.gather(
+                api.create_embeddings("first text", model),
+                api.create_embeddings("second text", model),
+            )
+
+    Documentation:
+    - API Documentation: https://albert.api.etalab.gouv.fr/documentation
+    - Swagger UI: https://albert.api.etalab.gouv.fr/swagger
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        api_key: str | None = None,
+        timeout: int = 30,
+        max_inflight: int = 200,
+        max_uploads: int = 8,
+    ) -> None:
+        """
+        Initialize the asynchronous Albert API client.
+
+        Args:
+            base_url: Base URL for the API (defaults to ALBERT_API_BASE_URL env var)
+            api_key: API key for authentication (defaults to ALBERT_API_KEY env var)
+            timeout: Request timeout in seconds
+            max_inflight: Maximum number of concurrent requests; aligns with the
+                typical HTTP/2 SETTINGS_MAX_CONCURRENT_STREAMS advertised per
+                connection, so large asyncio.gather fan-outs queue here instead
+                of tripping server GOAWAY frames
+            max_uploads: Maximum number of concurrent file uploads; uploads are
+                bandwidth-heavy and each holds an open file descriptor, so they
+                get a tighter gate than ordinary requests
+        """
+        self.base_url = (base_url or os.getenv("ALBERT_API_BASE_URL") or "").rstrip(
+            "/"
+        )
+        self.api_key = api_key or os.getenv("ALBERT_API_KEY")
+        self.timeout = timeout
+
+        if not self.base_url:
+            raise ValueError(
+                "Base URL is required. Set ALBERT_API_BASE_URL environment variable or pass base_url parameter."
+            )
+        if not self.api_key:
+            raise ValueError(
+                "API key is required. Set ALBERT_API_KEY environment variable or pass api_key parameter."
+            )
+
+        # Counts of retried responses, keyed by status code
+        self.retry_stats: Counter = Counter()
+
+        # Request counters for tuning pool limits and concurrency:
+        # requests, errors, rate_limited, inflight and max_inflight
+        self.stats: Counter = Counter()
+
+        # Token-bucket limiter, seeded from the server's X-RateLimit-Limit
+        # header on the first response (or set directly by the caller)
+        self.limiter: _TokenBucket | None = None
+
+        # Gate on in-flight requests so unbounded gather() calls don't
+        # exceed the server's HTTP/2 stream limit
+        self._sem = asyncio.Semaphore(max_inflight)
+
+        # Single-flight bookkeeping for concurrent identical GETs
+        self._inflight: dict[tuple, asyncio.Future] = {}
+
+        # Uploads are gated separately so a large ingest fan-out can't
+        # exhaust file descriptors or starve ordinary requests
+        self._upload_sem = asyncio.Semaphore(max_uploads)
+
+        import httpx
+
+        self.session = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                # zstd beats gzip on JSON bodies; httpx decodes it via the
+                # zstandard package
+                "Accept-Encoding": "zstd, gzip",
+            },
+            timeout=httpx.Timeout(self.timeout, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                retries=_MAX_RETRIES,
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=100,
+                    keepalive_expiry=30.0,
+                ),
+            ),
+        )
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> dict:
+        """
+        Make a request to the Albert API.
+
+        Identical GETs issued by concurrent coroutines are collapsed into a
+        single outstanding request whose result is shared.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            **kwargs: Additional request parameters
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            RuntimeError: If the request fails
+        """
+        if method != "GET":
+            return await self._do_request(method, endpoint, **kwargs)
+
+        key = _singleflight_key(endpoint, kwargs)
+        existing = self._inflight.get(key)
+        if existing is not None:
+            return await asyncio.shield(existing)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._do_request(method, endpoint, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # consumed here; waiters re-raise via await
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _do_request(self, method: str, endpoint: str, **kwargs) -> dict:
+        """Issue one request, with retries, and decode the response."""
+        import httpx
+
+        try:
+            kwargs = _encode_json(kwargs)
+            # File uploads cannot be replayed once the handle has been read
+            retries = 0 if "files" in kwargs else _MAX_RETRIES
+            for attempt in range(retries + 1):
+                if self.limiter is not None:
+                    await self.limiter.acquire_async()
+                async with self._sem:
+                    self.stats["requests"] += 1
+                    self.stats["inflight"] += 1
+                    self.stats["max_inflight"] = max(
+                        self.stats["max_inflight"], self.stats["inflight"]
+                    )
+                    try:
+                        response = await self.session.request(
+                            method=method, url=endpoint, **kwargs
+                        )
+                    finally:
+                        self.stats["inflight"] -= 1
+                if self.limiter is None:
+                    self.limiter = _limiter_from_headers(response.headers)
+                if response.status_code == 429:
+                    self.stats["rate_limited"] += 1
+                if response.status_code not in _RETRY_STATUS_CODES or attempt == retries:
+                    break
+                self.retry_stats[response.status_code] += 1
+                await asyncio.sleep(
+                    _retry_delay(attempt, response.headers.get("Retry-After"))
+                )
+            if response.status_code >= 400:
+                self.stats["errors"] += 1
+            response.raise_for_status()
+
+            # Handle empty responses
+            if response.status_code == 204:
+                return {}
+
+            return orjson.loads(response.content)
+
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"API request failed: {e}")
+        except orjson.JSONDecodeError as e:
+            raise RuntimeError(f"Failed to parse JSON response: {e}")
+
+    async def _upload(
+        self, endpoint: str, file_path: str | Path, media_type: str, data: dict,
+        kind: str = "File",
+    ) -> dict:
+        """
+        Upload a file as a multipart form request.
+
+        The open file handle is handed to httpx, which streams the multipart
+        body in chunks instead of buffering the whole file in memory, so large
+        uploads keep a flat memory profile and bytes hit the wire immediately.
+
+        Args:
+            endpoint: API endpoint
+            file_path: Path to the file to upload
+            media_type: Fallback MIME type when it cannot be guessed from the
+                file name
+            data: Additional form fields
+            kind: Label used in the not-found error message
+
+        Returns:
+            API response as dictionary
+        """
+        path_str = str(file_path)
+
+        if not os.path.isfile(path_str):
+            raise FileNotFoundError(f"{kind} not found: {path_str}")
+
+        name = os.path.basename(path_str)
+        media_type = mimetypes.guess_type(name)[0] or media_type
+
+        # The file is only opened once the semaphore is acquired, so queued
+        # uploads don't pile up open file descriptors while they wait
+        async with self._upload_sem:
+            with open(path_str, "rb") as f:
+                files = {"file": (name, f, media_type)}
+                return await self._make_request(
+                    "POST", endpoint, data=data, files=files
+                )
+
+    async def _iter_pages(
+        self, fetch: Callable, limit: int
+    ) -> AsyncIterator[dict]:
+        """
+        Iterate items across pages, prefetching the next page in the background.
+
+        While the caller consumes page N, page N+1 is already in flight as a
+        task, so server latency hides behind client processing. Iteration
+        stops on the first short page.
+        """
+        offset = 0
+        task = asyncio.create_task(fetch(offset, limit))
+        while True:
+            page = await task
+            items = page.get("data", [])
+            if len(items) == limit:
+                offset += limit
+                task = asyncio.create_task(fetch(offset, limit))
+            else:
+                task = None
+            for item in items:
+                yield item
+            if task is None:
+                break
+
+    # ============================================================================
+    # MODELS
+    # ============================================================================
+
+    async def get_models(self) -> dict:
+        """
+        Get list of available models.
+
+        Returns:
+            Dictionary containing available models. Each item in ``data`` typically
+            includes ``id``, ``type``, and an ``aliases`` list of short product names
+            accepted by the API (e.g. ``openweight-small``) alongside the technical id.
+        """
+        return await self._make_request("GET", _MODELS_ENDPOINT)
+
+    async def get_model(self, model: str) -> dict:
+        """
+        Get information about a specific model.
+
+        Args:
+            model: Model name/ID
+
+        Returns:
+            Model information
+        """
+        return await self._make_request("GET", _MODEL_PREFIX + model)
+
+    async def get_models_ids(self) -> list[str]:
+        """Get the list of the official names for all the available Albert models."""
+        try:
+            models = await self.get_models()
+            return [m["id"] for m in models.get("data", [])]
+        except Exception as e:
+            print(f"Unable to get the list of Albert models: {str(e)}")
+            return []
+
+    # ============================================================================
+    # CHAT COMPLETIONS
+    # ============================================================================
+
+    async def chat_completions(
+        self, messages: list[dict], model: str, **kwargs
+    ) -> dict:
+        """
+        Create a chat completion.
+
+        Args:
+            messages: List of message dictionaries
+            model: Model to use for completion
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Returns:
+            Chat completion response
+        """
+        kwargs["messages"] = messages
+        kwargs["model"] = model
+        return await self._make_request(
+            "POST", _CHAT_COMPLETIONS_ENDPOINT, json=kwargs
+        )
+
+    async def chat_completions_stream(
+        self, messages: list[dict], model: str, **kwargs
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion, yielding content fragments as they arrive.
+
+        The first fragment shows up at first-token latency instead of after
+        the whole completion has been generated, and many streams interleave
+        on one connection under asyncio.gather.
+
+        Args:
+            messages: List of message dictionaries
+            model: Model to use for completion
+            **kwargs: Additional parameters (temperature, max_tokens, etc.)
+
+        Yields:
+            Content fragments from the completion deltas
+
+        Raises:
+            RuntimeError: If the request fails
+        """
+        import httpx
+
+        kwargs["messages"] = messages
+        kwargs["model"] = model
+        kwargs["stream"] = True
+        try:
+            async with self.session.stream(
+                "POST", _CHAT_COMPLETIONS_ENDPOINT, **_encode_json({"json": kwargs})
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    content = _sse_delta_content(line)
+                    if content:
+                        yield content
+
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"API request failed: {e}")
+
+    async def agents_completions(
+        self, messages: list[dict], model: str, **kwargs
+    ) -> dict:
+        """
+        Create an agent completion with MCP bridge tools.
+
+        Args:
+            messages: List of message dictionaries
+            model: Model to use for completion
+            **kwargs: Additional parameters
+
+        Returns:
+            Agent completion response
+        """
+        kwargs["messages"] = messages
+        kwargs["model"] = model
+        return await self._make_request(
+            "POST", _AGENTS_COMPLETIONS_ENDPOINT, json=kwargs
+        )
+
+    async def get_agents_tools(self) -> dict:
+        """
+        Get available tools for agents.
+
+        Returns:
+            Available tools
+        """
+        return await self._make_request("GET", _AGENTS_TOOLS_ENDPOINT)
+
+    # ============================================================================
+    # EMBEDDINGS
+    # ============================================================================
+
+    async def create_embeddings(
+        self, input_text: str | list[str], model: str, **kwargs
+    ) -> dict:
+        """
+        Create embeddings for text.
+
+        Vectors are requested in base64/float32 form (about 4x smaller on
+        the wire than JSON float lists) and come back as NumPy float32
+        arrays. Pass encoding_format="float" for plain lists.
+
+        Args:
+            input_text: Text or list of texts to embed
+            model: Embedding model to use
+            **kwargs: Additional parameters (encoding_format, etc.)
+
+        Returns:
+            Embeddings response
+        """
+        kwargs["input"] = input_text
+        kwargs["model"] = model
+        kwargs.setdefault("encoding_format", "base64")
+        return _decode_embeddings(
+            await self._make_request("POST", _EMBEDDINGS_ENDPOINT, json=kwargs)
+        )
+
+    # ============================================================================
+    # AUDIO TRANSCRIPTION
+    # ============================================================================
+
+    async def transcribe_audio(
+        self, file_path: str | Path, model: str, **kwargs
+    ) -> dict:
+        """
+        Transcribe audio file.
+
+        Args:
+            file_path: Path to audio file
+            model: Transcription model to use
+            **kwargs: Additional parameters (language, response_format, etc.)
+
+        Returns:
+            Transcription response
+        """
+        kwargs["model"] = model
+        return await self._upload(
+            _AUDIO_TRANSCRIPTIONS_ENDPOINT, file_path, "audio/mpeg", kwargs,
+            kind="Audio file",
+        )
+
+    # ============================================================================
+    # DOCUMENT PROCESSING
+    # ============================================================================
+
+    async def parse_document(self, file_path: str | Path, **kwargs) -> dict:
+        """
+        Parse a document (PDF, etc.).
+
+        Args:
+            file_path: Path to document file
+            **kwargs: Additional parameters (output_format, force_ocr, etc.)
+
+        Returns:
+            Parsed document response
+        """
+        return await self._upload(
+            _PARSE_ENDPOINT, file_path, "application/pdf", kwargs,
+            kind="Document file",
+        )
+
+    async def ocr_document(self, file_path: str | Path, model: str, **kwargs) -> dict:
+        """
+        Extract text from PDF using OCR.
+
+        Args:
+            file_path: Path to PDF file
+            model: OCR model to use
+            **kwargs: Additional parameters (dpi, prompt, etc.)
+
+        Returns:
+            OCR response
+        """
+        kwargs["model"] = model
+        return await self._upload(
+            _OCR_ENDPOINT, file_path, "application/pdf", kwargs, kind="PDF file"
+        )
+
+    # ============================================================================
+    # COLLECTIONS AND DOCUMENTS
+    # ============================================================================
+
+    async def create_collection(
+        self, name: str, description: str | None = None, visibility: str = "private"
+    ) -> dict:
+        """
+        Create a new collection.
+
+        Args:
+            name: Collection name
+            description: Collection description
+            visibility: Collection visibility (private/public)
+
+        Returns:
+            Created collection response
+        """
+        data = {"name": name, "description": description, "visibility": visibility}
+        return await self._make_request("POST", _COLLECTIONS_ENDPOINT, json=data)
+
+    async def get_collections(self, offset: int = 0, limit: int = 10) -> dict:
+        """
+        Get list of collections.
+
+        Args:
+            offset: Pagination offset
+            limit: Number of collections to return
+
+        Returns:
+            Collections list
+        """
+        params = {"offset": offset, "limit": limit}
+        return await self._make_request("GET", _COLLECTIONS_ENDPOINT, params=params)
+
+    def iter_collections(self, limit: int = 10) -> AsyncIterator[dict]:
+        """
+        Iterate over all collections, fetching pages as needed.
+
+        Args:
+            limit: Page size used for the underlying requests
+
+        Yields:
+            Collection dictionaries
+        """
+
+        def fetch(offset: int, limit: int):
+            return self.get_collections(offset=offset, limit=limit)
+
+        return self._iter_pages(fetch, limit)
+
+    async def get_collection(self, collection_id: int) -> dict:
+        """
+        Get collection by ID.
+
+        Args:
+            collection_id: Collection ID
+
+        Returns:
+            Collection information
+        """
+        return await self._make_request("GET", _COLLECTION_PREFIX + str(collection_id))
+
+    async def update_collection(self, collection_id: int, **kwargs) -> None:
+        """
+        Update collection.
+
+        Args:
+            collection_id: Collection ID
+            **kwargs: Fields to update (name, description, visibility)
+        """
+        await self._make_request(
+            "PATCH", _COLLECTION_PREFIX + str(collection_id), json=kwargs
+        )
+
+    async def delete_collection(self, collection_id: int) -> None:
+        """
+        Delete collection.
+
+        Args:
+            collection_id: Collection ID
+        """
+        await self._make_request("DELETE", _COLLECTION_PREFIX + str(collection_id))
+
+    async def create_document(
+        self, file_path: str | Path, collection_id: int, **kwargs
+    ) -> dict:
+        """
+        Create a document in a collection.
+
+        Args:
+            file_path: Path to document file
+            collection_id: Collection ID
+            **kwargs: Additional parameters (chunk_size, output_format, etc.)
+
+        Returns:
+            Created document response
+        """
+        kwargs["collection"] = collection_id
+        return await self._upload(
+            _DOCUMENTS_ENDPOINT, file_path, "application/pdf", kwargs,
+            kind="Document file",
+        )
+
+    async def bulk_ingest(
+        self, file_paths: list[str | Path], collection_id: int, **kwargs
+    ) -> list[dict]:
+        """
+        Upload many documents to a collection concurrently.
+
+        Uploads fan out over the shared HTTP/2 connection, bounded by the
+        max_uploads semaphore.
+
+        Args:
+            file_paths: Paths to the document files
+            collection_id: Collection ID
+            **kwargs: Additional parameters (chunk_size, output_format, etc.)
+
+        Returns:
+            Created document responses, aligned with ``file_paths``
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    self.create_document(file_path, collection_id, **kwargs)
+                    for file_path in file_paths
+                )
+            )
+        )
+
+    async def get_documents(
+        self, collection_id: int | None = None, limit: int = 10, offset: int = 0
+    ) -> dict:
+        """
+        Get documents from collection.
+
+        Args:
+            collection_id: Collection ID (optional, to filter by collection)
+            limit: Number of documents to return
+            offset: Pagination offset
+
+        Returns:
+            Documents list
+        """
+        params = {"limit": limit, "offset": offset}
+        if collection_id is not None:
+            params["collection"] = collection_id
+
+        return await self._make_request("GET", _DOCUMENTS_ENDPOINT, params=params)
+
+    def iter_documents(
+        self, collection_id: int | None = None, limit: int = 10
+    ) -> AsyncIterator[dict]:
+        """
+        Iterate over all documents, fetching pages as needed.
+
+        Args:
+            collection_id: Collection ID (optional, to filter by collection)
+            limit: Page size used for the underlying requests
+
+        Yields:
+            Document dictionaries
+        """
+
+        def fetch(offset: int, limit: int):
+            return self.get_documents(collection_id, limit=limit, offset=offset)
+
+        return self._iter_pages(fetch, limit)
+
+    async def get_document(self, document_id: int) -> dict:
+        """
+        Get document by ID.
+
+        Args:
+            document_id: Document ID
+
+        Returns:
+            Document information
+        """
+        return await self._make_request("GET", _DOCUMENT_PREFIX + str(document_id))
+
+    async def delete_document(self, document_id: int) -> None:
+        """
+        Delete document.
+
+        Args:
+            document_id: Document ID
+        """
+        await self._make_request("DELETE", _DOCUMENT_PREFIX + str(document_id))
+
+    # ============================================================================
+    # CHUNKS
+    # ============================================================================
+
+    async def get_chunks(
+        self, document_id: int, limit: int = 10, offset: int = 0
+    ) -> dict:
+        """
+        Get chunks of a document.
+
+        Args:
+            document_id: Document ID
+            limit: Number of chunks to return
+            offset: Pagination offset
+
+        Returns:
+            Chunks list
+        """
+        params = {"limit": limit, "offset": offset}
+        return await self._make_request(
+            "GET", _CHUNKS_PREFIX + str(document_id), params=params
+        )
+
+    def iter_chunks(self, document_id: int, limit: int = 10) -> AsyncIterator[dict]:
+        """
+        Iterate over all chunks of a document, fetching pages as needed.
+
+        Args:
+            document_id: Document ID
+            limit: Page size used for the underlying requests
+
+        Yields:
+            Chunk dictionaries
+        """
+
+        def fetch(offset: int, limit: int):
+            return self.get_chunks(document_id, limit=limit, offset=offset)
+
+        return self._iter_pages(fetch, limit)
+
+    async def get_chunk(self, document_id: int, chunk_id: int) -> dict:
+        """
+        Get specific chunk of a document.
+
+        Args:
+            document_id: Document ID
+            chunk_id: Chunk ID
+
+        Returns:
+            Chunk information
+        """
+        return await self._make_request("GET", _CHUNKS_PREFIX + str(document_id) + "/" + str(chunk_id))
+
+    # ============================================================================
+    # SEARCH
+    # ============================================================================
+
+    async def search(
+        self, prompt: str, collections: list[int] | None = None, **kwargs
+    ) -> dict:
+        """
+        Search for relevant chunks.
+
+        Args:
+            prompt: Search query
+            collections: List of collection IDs to search in
+            **kwargs: Additional parameters (method, k, score_threshold, etc.)
+
+        Returns:
+            Search results
+        """
+        kwargs["prompt"] = prompt
+        kwargs["collections"] = collections or []
+        return await self._make_request("POST", _SEARCH_ENDPOINT, json=kwargs)
+
+    async def search_many(
+        self,
+        prompts: list[str],
+        collections: list[int] | None = None,
+        concurrency: int = 16,
+        **kwargs,
+    ) -> list[dict]:
+        """
+        Run many searches concurrently over the shared HTTP/2 connection.
+
+        Args:
+            prompts: Search queries
+            collections: List of collection IDs to search in
+            concurrency: Maximum number of searches in flight
+            **kwargs: Additional parameters (method, k, score_threshold, etc.)
+
+        Returns:
+            Search results, aligned with ``prompts``
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(prompt: str) -> dict:
+            async with sem:
+                return await self.search(prompt, collections, **kwargs)
+
+        return list(await asyncio.gather(*map(one, prompts)))
+
+    # ============================================================================
+    # RERANK
+    # ============================================================================
+
+    async def rerank(self, prompt: str, input_texts: list[str], model: str) -> dict:
+        """
+        Rerank texts by relevance to prompt.
+
+        Args:
+            prompt: Reranking prompt
+            input_texts: List of texts to rerank
+            model: Reranking model to use
+
+        Returns:
+            Reranking results
+        """
+        data = {"prompt": prompt, "input": input_texts, "model": model}
+        return await self._make_request("POST", _RERANK_ENDPOINT, json=data)
+
+    async def rerank_many(
+        self, prompts: list[str], input_texts: list[str], model: str
+    ) -> list[dict]:
+        """
+        Rerank the same texts against many prompts concurrently.
+
+        Args:
+            prompts: Reranking prompts
+            input_texts: List of texts to rerank
+            model: Reranking model to use
+
+        Returns:
+            Reranking results, one per prompt, in the same order
+        """
+        return list(
+            await asyncio.gather(
+                *(self.rerank(prompt, input_texts, model) for prompt in prompts)
+            )
+        )
+
+    # ============================================================================
+    # USAGE
+    # ============================================================================
+
+    async def get_usage(self, limit: int = 50, page: int = 1, **kwargs) -> dict:
+        """
+        Get account usage information.
+
+        Args:
+            limit: Number of records per page
+            page: Page number
+            **kwargs: Additional parameters (order_by, order_direction, date_from, date_to)
+
+        Returns:
+            Usage information
+        """
+        kwargs["limit"] = limit
+        kwargs["page"] = page
+        return await self._make_request("GET", _USAGE_ENDPOINT, params=kwargs)
+
+    # ============================================================================
+    # TOKEN MANAGEMENT
+    # ============================================================================
+
+    async def create_token(
+        self, name: str, user: int | None = None, expires_at: int | None = None
+    ) -> dict:
+        """
+        Create a new token.
+
+        Args:
+            name: Token name
+            user: User ID (optional, for admin use)
+            expires_at: Expiration timestamp (optional)
+
+        Returns:
+            Created token response
+        """
+        data = {"name": name}
+        if user is not None:
+            data["user"] = user
+        if expires_at is not None:
+            data["expires_at"] = expires_at
+
+        return await self._make_request("POST", _TOKENS_ENDPOINT, json=data)
+
+    async def get_tokens(self, offset: int = 0, limit: int = 10, **kwargs) -> dict:
+        """
+        Get list of tokens.
+
+        Args:
+            offset: Pagination offset
+            limit: Number of tokens to return
+            **kwargs: Additional parameters (order_by, order_direction)
+
+        Returns:
+            Tokens list
+        """
+        kwargs["offset"] = offset
+        kwargs["limit"] = limit
+        return await self._make_request("GET", _TOKENS_ENDPOINT, params=kwargs)
+
+    async def get_token(self, token_id: int) -> dict:
+        """
+        Get token by ID.
+
+        Args:
+            token_id: Token ID
+
+        Returns:
+            Token information
+        """
+        return await self._make_request("GET", _TOKEN_PREFIX + str(token_id))
+
+    async def delete_token(self, token_id: int) -> None:
+        """
+        Delete token.
+
+        Args:
+            token_id: Token ID
+        """
+        await self._make_request("DELETE", _TOKEN_PREFIX + str(token_id))
+
+    async def close(self) -> None:
+        """Close the session."""
+        await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class EmbeddingFastPath:
+    """
+    Pre-serialized request bodies for hot embedding loops.
+
+    Embedding loops re-send near-identical payloads that differ only in the
+    input text. The stable part (model plus extra parameters) is encoded
+    once at construction; each call splices in only the input, skipping a
+    full JSON encode per request:
+
+        fast = EmbeddingFastPath(api, model="embedding-model")
+        for text in texts:
+            response = fast.embed(text)
+
+    Works with both clients; with an :class:`AsyncAlbertAPI` the return
+    value of :meth:`embed` must be awaited.
+    """
+
+    def __init__(self, api: AlbertAPI | AsyncAlbertAPI, model: str, **kwargs) -> None:
+        """
+        Initialize the fast path.
+
+        Args:
+            api: Client used to issue the requests
+            model: Embedding model to use
+            **kwargs: Additional stable parameters sent with every request
+        """
+        self.api = api
+        kwargs["model"] = model
+        # Drop the closing brace; "input" is spliced in per call
+        self._prefix = orjson.dumps(kwargs)[:-1]
+
+    def embed(self, input_text: str | list[str]):
+        """
+        Create embeddings for text, reusing the pre-serialized payload.
+
+        Args:
+            input_text: Text or list of texts to embed
+
+        Returns:
+            Embeddings response (a coroutine when built on the async client)
+        """
+        body = self._prefix + b',"input":' + orjson.dumps(input_text) + b"}"
+        return self.api._make_request(
+            "POST",
+            _EMBEDDINGS_ENDPOINT,
+            content=body,
+            headers={"Content-Type": "application/json"},
+        )
+
+
+class EmbeddingBatcher:
+    """
+    Transparent micro-batching for single-text embedding calls.
+
+    Callers that embed texts one by one pay one HTTP round-trip per text.
+    This helper buffers individual ``embed`` calls for a short window (or
+    until a size threshold) and issues a single ``/v1/embeddings`` request
+    with the whole batch, then resolves each caller's future with its own
+    embedding:
+
+        batcher = EmbeddingBatcher(api, model="embedding-model")
+        embeddings = await asyncio.gather(*(batcher.embed(t) for t in texts))
+    """
+
+    def __init__(
+        self,
+        api: AsyncAlbertAPI,
+        model: str,
+        max_batch: int = 64,
+        max_delay_ms: float = 10.0,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            api: Async client used to issue the batched requests
+            model: Embedding model to use
+            max_batch: Maximum number of texts per request
+            max_delay_ms: Maximum time a text waits before its batch is flushed
+        """
+        self.api = api
+        self.model = model
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000.0
+        self._pending: deque[tuple[str, asyncio.Future]] = deque()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    def embed(self, text: str) -> asyncio.Future:
+        """
+        Queue a text for embedding.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Future resolving to the embedding vector for this text
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._schedule_flush(loop)
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self.max_delay, self._schedule_flush, loop
+            )
+
+        return future
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        # Keep a reference to the task so it is not garbage-collected mid-flight
+        task = loop.create_task(self._flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self) -> None:
+        batch: list[tuple[str, asyncio.Future]] = []
+        while self._pending and len(batch) < self.max_batch:
+            batch.append(self._pending.popleft())
+
+        if not batch:
+            return
+
+        # Leftover texts beyond max_batch go out in the next window
+        if self._pending and self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(
+                self.max_delay, self._schedule_flush, loop
+            )
+
+        texts = [text for text, _ in batch]
+        try:
+            response = await self.api.create_embeddings(texts, self.model)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), item in zip(batch, response["data"]):
+            if not future.done():
+                future.set_result(item["embedding"])
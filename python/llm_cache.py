@@ -0,0 +1,190 @@
+"""
+Albert API Python Client - Local LLM response cache
+
+Deterministic on-disk cache for chat completions and embeddings, keyed by a
+SHA-256 digest of the output-affecting parameters (model, normalized
+messages/input, sampling settings). Identical prompts resent during test
+re-runs are answered from a SQLite database instead of a 1-10 s round-trip.
+
+The cache is opt-in: set ALBERT_RESPONSE_CACHE=1 to enable it. Completions
+are stochastic by default, so replaying recorded responses silently would
+change behavior for callers that expect fresh samples.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import time
+import unicodedata
+
+import orjson
+
+# Environment variable that enables the cache when set to a truthy value
+_CACHE_ENV_VAR = "ALBERT_RESPONSE_CACHE"
+
+_CACHE_PATH = os.path.expanduser("~/.cache/albert/cache.sqlite")
+
+# Entries older than this are treated as misses and deleted on lookup
+_TTL_SECONDS = 7 * 24 * 3600
+
+# Least-recently-used entries beyond this count are evicted on insert
+_MAX_ENTRIES = 4096
+
+# Parameters that affect the output and therefore take part in the digest.
+# Anything else (stream, user, request IDs, the API key) is excluded.
+_HASHED_PARAMS = (
+    "max_completion_tokens",
+    "max_tokens",
+    "temperature",
+    "top_p",
+    "tools",
+    "response_format",
+    "encoding_format",
+)
+
+
+def _enabled() -> bool:
+    """Return True when the response cache is switched on."""
+    return os.getenv(_CACHE_ENV_VAR, "").lower() not in ("", "0", "false", "no")
+
+
+def _normalize(value):
+    """Recursively NFC-normalize and trim strings so that visually identical
+    prompts hash to the same digest."""
+    if isinstance(value, str):
+        return unicodedata.normalize("NFC", value).strip()
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def _digest(call: str, payload, model: str, kwargs: dict) -> str:
+    """
+    Compute the cache key for one call.
+
+    Args:
+        call: Name of the decorated method
+        payload: Messages or input text
+        model: Model name
+        kwargs: Additional call parameters
+
+    Returns:
+        Hex SHA-256 digest over the output-affecting parameters
+    """
+    material = {
+        "call": call,
+        "model": model,
+        "payload": _normalize(payload),
+    }
+    for name in _HASHED_PARAMS:
+        if name in kwargs:
+            material[name] = _normalize(kwargs[name])
+    return hashlib.sha256(
+        orjson.dumps(material, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+
+
+def _connect():
+    """Open the cache database, creating the directory and table if needed."""
+    import sqlite3
+
+    os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+    connection = sqlite3.connect(_CACHE_PATH)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "digest TEXT PRIMARY KEY, "
+        "body BLOB NOT NULL, "
+        "created_at REAL NOT NULL, "
+        "used_at REAL NOT NULL)"
+    )
+    return connection
+
+
+def _get(digest: str) -> dict | None:
+    """Return the cached response for digest, or None on miss/expiry."""
+    with _connect() as connection:
+        row = connection.execute(
+            "SELECT body, created_at FROM responses WHERE digest = ?", (digest,)
+        ).fetchone()
+        if row is None:
+            return None
+        body, created_at = row
+        now = time.time()
+        if now - created_at > _TTL_SECONDS:
+            connection.execute(
+                "DELETE FROM responses WHERE digest = ?", (digest,)
+            )
+            return None
+        connection.execute(
+            "UPDATE responses SET used_at = ? WHERE digest = ?", (now, digest)
+        )
+        return orjson.loads(body)
+
+
+def _put(digest: str, result: dict) -> None:
+    """Store a response and evict least-recently-used entries over the cap."""
+    now = time.time()
+    with _connect() as connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO responses (digest, body, created_at, used_at) "
+            "VALUES (?, ?, ?, ?)",
+            (digest, orjson.dumps(result), now, now),
+        )
+        connection.execute(
+            "DELETE FROM responses WHERE digest IN ("
+            "SELECT digest FROM responses ORDER BY used_at DESC "
+            "LIMIT -1 OFFSET ?)",
+            (_MAX_ENTRIES,),
+        )
+
+
+def clear_cache() -> None:
+    """Drop every cached response."""
+    with _connect() as connection:
+        connection.execute("DELETE FROM responses")
+
+
+def cached_call(payload_param: str):
+    """
+    Cache a ``(payload, model, **kwargs)`` API method on disk.
+
+    Payload and model may be passed positionally or by keyword — the
+    decorated method keeps its own parameter names, so documented call
+    forms like ``chat_completions(messages=..., model=...)`` still work.
+    Streaming calls and calls made while ALBERT_RESPONSE_CACHE is unset
+    bypass the cache entirely.
+
+    Args:
+        payload_param: Name of the payload parameter of the decorated
+            method (``messages``, ``input_text``, ...)
+
+    Returns:
+        Decorator answering repeats from the SQLite cache
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not _enabled() or kwargs.get("stream"):
+                return func(self, *args, **kwargs)
+            # Keyword arguments can only follow positional ones, so a
+            # positional payload implies model is args[1] or a keyword
+            payload = (
+                kwargs[payload_param] if payload_param in kwargs else args[0]
+            )
+            model = kwargs["model"] if "model" in kwargs else args[1]
+            digest = _digest(func.__name__, payload, model, kwargs)
+            cached = _get(digest)
+            if cached is not None:
+                return cached
+            result = func(self, *args, **kwargs)
+            _put(digest, result)
+            return result
+
+        return wrapper
+
+    return decorator
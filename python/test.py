@@ -14,14 +14,17 @@ Usage:
     python test.py --collections      # Test collections management
     python test.py --documents        # Test documents and chunks
     python test.py --search           # Test search functionality
+    python test.py --async            # Test concurrent async requests
     python test.py --all              # Run all tests
 """
 
+import asyncio
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
-from albert_api import AlbertAPI
+from albert_api import AlbertAPI, AsyncAlbertAPI
 
 # Load environment variables from .env file for testing
 load_dotenv()
@@ -41,6 +44,7 @@ def test_initialization() -> None:
         print("  python test.py")
         return
 
+    api = None
     try:
         # Initialize the API client
         api = AlbertAPI()
@@ -51,21 +55,25 @@ def test_initialization() -> None:
         models = api.get_models()
         print(f"✅ Successfully connected! Found {len(models.get('data', []))} models")
 
-        api.close()
         print("\n✅ Initialization test completed successfully!")
 
     except Exception as e:
         print(f"❌ Initialization Error: {e}")
+    finally:
+        if api is not None:
+            api.close()
 
 
-def test_models() -> None:
+def test_models(api: AlbertAPI | None = None) -> None:
     """Test models endpoint."""
     print("🧪 Testing Models Endpoint")
     print("=" * 50)
 
     try:
-        api = AlbertAPI()
-        print("✅ Albert API client initialized successfully!")
+        owns_client = api is None
+        if owns_client:
+            api = AlbertAPI()
+            print("✅ Albert API client initialized successfully!")
 
         # Get all models
         print("\n📋 Getting all available models:")
@@ -92,21 +100,25 @@ def test_models() -> None:
             model_details = api.get_model(first_model["id"])
             print(f"✅ Successfully retrieved details for {model_details['id']}")
 
-        api.close()
         print("\n✅ Models test completed successfully!")
 
     except Exception as e:
         print(f"❌ Models Test Error: {e}")
+    finally:
+        if owns_client and api is not None:
+            api.close()
 
 
-def test_completions() -> None:
+def test_completions(api: AlbertAPI | None = None) -> None:
     """Test chat completions endpoint."""
     print("🧪 Testing Chat Completions Endpoint")
     print("=" * 50)
 
     try:
-        api = AlbertAPI()
-        print("✅ Albert API client initialized successfully!")
+        owns_client = api is None
+        if owns_client:
+            api = AlbertAPI()
+            print("✅ Albert API client initialized successfully!")
 
         # Get text-generation models
         models = api.get_models()
@@ -121,83 +133,88 @@ def test_completions() -> None:
         model = text_models[0]["id"]
         print(f"🎯 Using model: {model}")
 
-        # Test 1: Simple completion
-        print("\n📝 Test 1: Simple completion")
-        response1 = api.chat_completions(
-            [{"role": "user", "content": "Explain quantum computing in one sentence."}],
-            model,
-            max_completion_tokens=100,
-        )
+        # The three prompts are independent, so they go out concurrently
+        # and the test takes max() of the three latencies instead of the sum
+        tests = [
+            (
+                "📝 Test 1: Simple completion",
+                [
+                    {
+                        "role": "user",
+                        "content": "Explain quantum computing in one sentence.",
+                    }
+                ],
+                100,
+            ),
+            (
+                "🇫🇷 Test 2: French conversation",
+                [
+                    {
+                        "role": "system",
+                        "content": "Tu es un assistant français très utile.",
+                    },
+                    {
+                        "role": "user",
+                        "content": "Qu'est-ce que l'intelligence artificielle ?",
+                    },
+                ],
+                150,
+            ),
+            (
+                "💻 Test 3: Code generation",
+                [
+                    {
+                        "role": "user",
+                        "content": "Write a Python function to calculate factorial.",
+                    }
+                ],
+                200,
+            ),
+        ]
 
-        if response1.get("choices") and response1["choices"][0].get("message", {}).get(
-            "content"
-        ):
-            print(f"🤖 Response: {response1['choices'][0]['message']['content']}")
-            print(
-                f"📊 Tokens used: {response1.get('usage', {}).get('total_tokens', 0)}"
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            responses = list(
+                executor.map(
+                    lambda item: api.chat_completions(
+                        item[1], model, max_completion_tokens=item[2]
+                    ),
+                    tests,
+                )
             )
-        else:
-            print("❌ No response received")
-
-        # Test 2: French conversation
-        print("\n🇫🇷 Test 2: French conversation")
-        response2 = api.chat_completions(
-            [
-                {
-                    "role": "system",
-                    "content": "Tu es un assistant français très utile.",
-                },
-                {
-                    "role": "user",
-                    "content": "Qu'est-ce que l'intelligence artificielle ?",
-                },
-            ],
-            model,
-            max_completion_tokens=150,
-        )
 
-        if response2.get("choices") and response2["choices"][0].get("message", {}).get(
-            "content"
-        ):
-            print(f"🤖 Response: {response2['choices'][0]['message']['content']}")
-        else:
-            print("❌ No response received")
-
-        # Test 3: Code generation
-        print("\n💻 Test 3: Code generation")
-        response3 = api.chat_completions(
-            [
-                {
-                    "role": "user",
-                    "content": "Write a Python function to calculate factorial.",
-                }
-            ],
-            model,
-            max_completion_tokens=200,
-        )
-
-        if response3.get("choices") and response3["choices"][0].get("message", {}).get(
-            "content"
-        ):
-            print(f"🤖 Response: {response3['choices'][0]['message']['content']}")
-        else:
-            print("❌ No response received")
+        for (label, _, _), response in zip(tests, responses):
+            print(f"\n{label}")
+            if response.get("choices") and response["choices"][0].get(
+                "message", {}
+            ).get("content"):
+                print(
+                    f"🤖 Response: {response['choices'][0]['message']['content']}"
+                )
+                print(
+                    f"📊 Tokens used: {response.get('usage', {}).get('total_tokens', 0)}"
+                )
+            else:
+                print("❌ No response received")
 
-        api.close()
         print("\n✅ Chat completions test completed successfully!")
 
     except Exception as e:
         print(f"❌ Completions Test Error: {e}")
+    finally:
+        if owns_client and api is not None:
+            api.close()
 
 
-def test_embeddings() -> None:
+def test_embeddings(api: AlbertAPI | None = None) -> None:
     """Test embeddings endpoint."""
     print("🧪 Testing Embeddings Endpoint")
     print("=" * 50)
 
     try:
-        api = AlbertAPI()
-        print("✅ Albert API client initialized successfully!")
+        owns_client = api is None
+        if owns_client:
+            api = AlbertAPI()
+            print("✅ Albert API client initialized successfully!")
 
         # Get embedding models
         models = api.get_models()
@@ -219,9 +236,9 @@ def test_embeddings() -> None:
         text1 = "Hello, this is a test sentence for embeddings."
         response1 = api.create_embeddings(text1, model)
 
-        if response1.get("data") and response1["data"][0].get("embedding"):
+        if response1.get("data") and len(response1["data"][0].get("embedding", ())):
             print(
-                f"✅ Successfully created embedding with {len(response1['data'][0]['embedding'])} dimensions"
+                f"✅ Successfully created embedding with {response1['data'][0]['embedding'].shape[0]} dimensions"
             )
             print(
                 f"📊 Tokens used: {response1.get('usage', {}).get('total_tokens', 0)}"
@@ -241,25 +258,29 @@ def test_embeddings() -> None:
         if response2.get("data"):
             print(f"✅ Successfully created {len(response2['data'])} embeddings")
             for i, item in enumerate(response2["data"]):
-                print(f"  {i + 1}. {texts[i]} → {len(item['embedding'])} dimensions")
+                print(f"  {i + 1}. {texts[i]} → {item['embedding'].shape[0]} dimensions")
         else:
             print("❌ No embeddings received")
 
-        api.close()
         print("\n✅ Embeddings test completed successfully!")
 
     except Exception as e:
         print(f"❌ Embeddings Test Error: {e}")
+    finally:
+        if owns_client and api is not None:
+            api.close()
 
 
-def test_usage() -> None:
+def test_usage(api: AlbertAPI | None = None) -> None:
     """Test usage endpoint."""
     print("🧪 Testing Usage Endpoint")
     print("=" * 50)
 
     try:
-        api = AlbertAPI()
-        print("✅ Albert API client initialized successfully!")
+        owns_client = api is None
+        if owns_client:
+            api = AlbertAPI()
+            print("✅ Albert API client initialized successfully!")
 
         # Get usage information
         print("\n📊 Getting usage information:")
@@ -284,21 +305,25 @@ def test_usage() -> None:
         else:
             print("ℹ️  No usage records found")
 
-        api.close()
         print("\n✅ Usage test completed successfully!")
 
     except Exception as e:
         print(f"❌ Usage Test Error: {e}")
+    finally:
+        if owns_client and api is not None:
+            api.close()
 
 
-def test_collections() -> None:
+def test_collections(api: AlbertAPI | None = None) -> None:
     """Test collections endpoint."""
     print("🧪 Testing Collections Endpoint")
     print("=" * 50)
 
     try:
-        api = AlbertAPI()
-        print("✅ Albert API client initialized successfully!")
+        owns_client = api is None
+        if owns_client:
+            api = AlbertAPI()
+            print("✅ Albert API client initialized successfully!")
 
         # Get existing collections
         print("\n📋 Getting existing collections:")
@@ -348,21 +373,25 @@ def test_collections() -> None:
         else:
             print("❌ Failed to create collection")
 
-        api.close()
         print("\n✅ Collections test completed successfully!")
 
     except Exception as e:
         print(f"❌ Collections Test Error: {e}")
+    finally:
+        if owns_client and api is not None:
+            api.close()
 
 
-def test_documents() -> None:
+def test_documents(api: AlbertAPI | None = None) -> None:
     """Test documents endpoint."""
     print("🧪 Testing Documents Endpoint")
     print("=" * 50)
 
     try:
-        api = AlbertAPI()
-        print("✅ Albert API client initialized successfully!")
+        owns_client = api is None
+        if owns_client:
+            api = AlbertAPI()
+            print("✅ Albert API client initialized successfully!")
 
         # Get existing documents
         print("\n📋 Getting existing documents:")
@@ -391,29 +420,37 @@ def test_documents() -> None:
 
             if chunks.get("data"):
                 print(f"✅ Found {len(chunks['data'])} chunks")
+                # Compute each preview once; skip the copy for short content
                 for chunk in chunks["data"]:
-                    content_preview = chunk.get("content", "")[:100]
-                    print(f"  Chunk {chunk['id']}: {content_preview}...")
+                    content = chunk.get("content", "")
+                    preview = (
+                        content if len(content) <= 100 else content[:97] + "..."
+                    )
+                    print(f"  Chunk {chunk['id']}: {preview}")
             else:
                 print("ℹ️  No chunks found for this document")
         else:
             print("ℹ️  No documents available for testing")
 
-        api.close()
         print("\n✅ Documents test completed successfully!")
 
     except Exception as e:
         print(f"❌ Documents Test Error: {e}")
+    finally:
+        if owns_client and api is not None:
+            api.close()
 
 
-def test_search() -> None:
+def test_search(api: AlbertAPI | None = None) -> None:
     """Test search endpoint."""
     print("🧪 Testing Search Endpoint")
     print("=" * 50)
 
     try:
-        api = AlbertAPI()
-        print("✅ Albert API client initialized successfully!")
+        owns_client = api is None
+        if owns_client:
+            api = AlbertAPI()
+            print("✅ Albert API client initialized successfully!")
 
         # Get collections for search
         print("\n🔍 Getting collections for search:")
@@ -439,19 +476,75 @@ def test_search() -> None:
                 for i, result in enumerate(search_results["data"], 1):
                     print(f"  {i}. Score: {result.get('score', 0):.3f}")
                     print(f"     - Method: {result.get('method', 'N/A')}")
-                    content_preview = result.get("chunk", {}).get("content", "")[:150]
-                    print(f"     - Content: {content_preview}...")
+                    content = result.get("chunk", {}).get("content", "")
+                    preview = (
+                        content if len(content) <= 150 else content[:147] + "..."
+                    )
+                    print(f"     - Content: {preview}")
                     print()
             else:
                 print("ℹ️  No search results found")
         else:
             print("ℹ️  No collections available for search")
 
-        api.close()
         print("\n✅ Search test completed successfully!")
 
     except Exception as e:
         print(f"❌ Search Test Error: {e}")
+    finally:
+        if owns_client and api is not None:
+            api.close()
+
+
+async def _run_async_demo() -> None:
+    """Fire several embedding requests concurrently over one connection."""
+    async with AsyncAlbertAPI() as api:
+        models = await api.get_models()
+        embedding_models = [
+            m
+            for m in models.get("data", [])
+            if m["type"] == "text-embeddings-inference"
+        ]
+
+        if not embedding_models:
+            print("ℹ️  No embedding models available")
+            return
+
+        model = embedding_models[0]["id"]
+        print(f"🎯 Using model: {model}")
+
+        texts = [
+            "First sentence for concurrent embedding.",
+            "Second sentence for concurrent embedding.",
+            "Third sentence for concurrent embedding.",
+            "Fourth sentence for concurrent embedding.",
+        ]
+
+        print(f"\n📝 Embedding {len(texts)} texts concurrently with asyncio.gather")
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            *(api.create_embeddings(text, model) for text in texts)
+        )
+        elapsed = time.perf_counter() - start
+
+        for text, response in zip(texts, responses):
+            dimensions = response["data"][0]["embedding"].shape[0]
+            print(f"  {text} → {dimensions} dimensions")
+
+        print(f"✅ Completed {len(texts)} concurrent requests in {elapsed:.2f}s")
+
+
+def test_async() -> None:
+    """Test concurrent requests with the async client."""
+    print("🧪 Testing Async Client (concurrent requests)")
+    print("=" * 50)
+
+    try:
+        asyncio.run(_run_async_demo())
+        print("\n✅ Async test completed successfully!")
+
+    except Exception as e:
+        print(f"❌ Async Test Error: {e}")
 
 
 def test_all() -> None:
@@ -459,22 +552,42 @@ def test_all() -> None:
     print("🧪 Running All Tests")
     print("=" * 50)
 
-    tests: list[tuple] = [
+    # One client for the whole suite: connections stay pooled across tests
+    # and the TTL-cached metadata lookups (get_models, ...) hit the API once
+    api = AlbertAPI()
+
+    # Collections creates and deletes server-side state that the documents
+    # and search tests read, so it runs alone after the read-only batch
+    parallel_tests: list[tuple] = [
         ("Initialization", test_initialization),
-        ("Models", test_models),
-        ("Completions", test_completions),
-        ("Embeddings", test_embeddings),
-        ("Usage", test_usage),
-        ("Collections", test_collections),
-        ("Documents", test_documents),
-        ("Search", test_search),
+        ("Models", lambda: test_models(api)),
+        ("Completions", lambda: test_completions(api)),
+        ("Embeddings", lambda: test_embeddings(api)),
+        ("Usage", lambda: test_usage(api)),
+        ("Documents", lambda: test_documents(api)),
+        ("Search", lambda: test_search(api)),
+        ("Async", test_async),
     ]
 
-    for test_name, test_func in tests:
-        print(f"\n🚀 Running {test_name} Test...")
+    # The read-only tests are network-bound and safe to overlap on the
+    # thread-safe httpx client: wall time approaches the slowest test
+    # instead of the sum of all of them
+    try:
+        with ThreadPoolExecutor(max_workers=len(parallel_tests)) as executor:
+            futures = {
+                executor.submit(test_func): test_name
+                for test_name, test_func in parallel_tests
+            }
+            for future in as_completed(futures):
+                future.result()
+                print(f"✅ {futures[future]} Test Completed")
+
+        print("\n🚀 Running Collections Test...")
         print("-" * 30)
-        test_func()
-        print(f"✅ {test_name} Test Completed")
+        test_collections(api)
+        print("✅ Collections Test Completed")
+    finally:
+        api.close()
 
     print("\n🎉 All tests completed!")
 
@@ -497,6 +610,8 @@ def main() -> None:
         test_documents()
     elif "--search" in args:
         test_search()
+    elif "--async" in args:
+        test_async()
     elif "--all" in args:
         test_all()
     else:
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Albert API Python Client - Short description prompts test
+
+Generates a short description for data.gouv.fr datasets with the Albert API.
+Dataset IDs are read from datasets.json and prompt templates from
+prompts.json; dataset metadata (title, description, organization) is fetched
+from the data.gouv.fr API.
+
+Usage:
+    python test_short-description_prompts.py
+"""
+
+import asyncio
+import functools
+import hashlib
+import mmap
+import os
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+import httpx
+import orjson
+from dotenv import load_dotenv
+
+from albert_api import AsyncAlbertAPI
+
+# Load environment variables from .env file for testing
+load_dotenv()
+
+DATAGOUV_API_BASE_URL = "https://www.data.gouv.fr/api/1"
+DESCRIPTION_SHORT_MAX_LENGTH = 200
+MODEL = "albert-small"
+
+# On-disk ETag index so unchanged datasets cost a 304 with no body to
+# download or parse on later runs
+_DATASET_CACHE_PATH = os.path.expanduser("~/.cache/albert/datagouv.sqlite")
+
+# ``${var}`` placeholders are rewritten to ``{var}`` once at load time so
+# interpolation is a single C-level str.format_map pass per template
+_PLACEHOLDER_PATTERN = re.compile(r"\$\{(\w+)\}")
+
+
+def _read_json(path: Path):
+    """
+    Parse a JSON file through mmap, zero-copy from the OS page cache.
+
+    Args:
+        path: File to parse
+
+    Returns:
+        Parsed JSON value
+    """
+    with open(path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+
+
+def _dataset_cache() -> sqlite3.Connection:
+    """Open the dataset metadata cache, creating it if needed."""
+    os.makedirs(os.path.dirname(_DATASET_CACHE_PATH), exist_ok=True)
+    connection = sqlite3.connect(_DATASET_CACHE_PATH)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS datasets ("
+        "dataset_id TEXT PRIMARY KEY, "
+        "etag TEXT NOT NULL, "
+        "payload BLOB NOT NULL)"
+    )
+    return connection
+
+
+def datagouv_client() -> httpx.AsyncClient:
+    """
+    Build the pooled data.gouv.fr client shared across the whole run.
+
+    Returns:
+        AsyncClient with HTTP/2 and keep-alive connections enabled
+    """
+    return httpx.AsyncClient(
+        base_url=DATAGOUV_API_BASE_URL,
+        http2=True,
+        headers={"accept": "application/json"},
+        timeout=30,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def load_prompts(prompts_file: str = "prompts.json") -> tuple[dict, ...]:
+    """
+    Load the prompt templates (read and parsed once per file).
+
+    Args:
+        prompts_file: Path to the prompts JSON file
+
+    Returns:
+        Tuple of message templates with ``{...}`` format placeholders
+    """
+    prompts_path = Path(__file__).parent / prompts_file
+    return tuple(
+        {
+            "role": prompt["role"],
+            "content": _PLACEHOLDER_PATTERN.sub(r"{\1}", prompt["content"]),
+        }
+        for prompt in _read_json(prompts_path)
+    )
+
+
+def interpolate_prompt(
+    title: str, description: str, organization_name: str
+) -> list[dict]:
+    """
+    Build the chat messages for one dataset from the prompt templates.
+
+    Args:
+        title: Dataset title
+        description: Full dataset description
+        organization_name: Name of the publishing organization
+
+    Returns:
+        List of message dictionaries ready for chat_completions
+    """
+    values = {
+        "description_short_max_length": str(DESCRIPTION_SHORT_MAX_LENGTH),
+        "description": description,
+        "title": title,
+        "organization_name": organization_name,
+    }
+
+    return [
+        {"role": prompt["role"], "content": prompt["content"].format_map(values)}
+        for prompt in load_prompts()
+    ]
+
+
+async def get_dataset_info(
+    client: httpx.AsyncClient, dataset_id: str
+) -> tuple[str, str, str]:
+    """
+    Fetch title, description and organization name for a dataset.
+
+    Dataset metadata rarely changes between runs, so the previously seen
+    ETag is sent as If-None-Match: a 304 reply carries no body and the
+    cached payload is reused.
+
+    Args:
+        client: Shared data.gouv.fr HTTP client
+        dataset_id: data.gouv.fr dataset ID
+
+    Returns:
+        Tuple of (title, description, organization_name)
+    """
+    with _dataset_cache() as cache:
+        row = cache.execute(
+            "SELECT etag, payload FROM datasets WHERE dataset_id = ?",
+            (dataset_id,),
+        ).fetchone()
+
+    headers = {"if-none-match": row[0]} if row else None
+    response = await client.get(f"/datasets/{dataset_id}/", headers=headers)
+
+    if response.status_code == 304 and row:
+        dataset = orjson.loads(row[1])
+    else:
+        response.raise_for_status()
+        dataset = orjson.loads(response.content)
+        etag = response.headers.get("etag")
+        if etag:
+            with _dataset_cache() as cache:
+                cache.execute(
+                    "INSERT OR REPLACE INTO datasets "
+                    "(dataset_id, etag, payload) VALUES (?, ?, ?)",
+                    (dataset_id, etag, response.content),
+                )
+
+    title = dataset.get("title", "")
+    description = dataset.get("description", "")
+    organization = dataset.get("organization") or {}
+    organization_name = organization.get("name", "")
+
+    return title, description, organization_name
+
+
+async def generate_short_description(
+    api: AsyncAlbertAPI,
+    messages: list[dict],
+    inflight: dict[str, asyncio.Future],
+) -> str:
+    """
+    Generate one short description, coalescing duplicate prompts.
+
+    Datasets that interpolate to byte-identical messages (mirrors,
+    versioned reruns) share a single completion for the whole run instead
+    of each paying their own LLM call.
+
+    Args:
+        api: Shared Albert API client
+        messages: Chat messages for the completion
+        inflight: Per-run futures keyed by prompt digest
+
+    Returns:
+        Generated short description
+    """
+    key = hashlib.sha256(orjson.dumps(messages)).hexdigest()
+    existing = inflight.get(key)
+    if existing is not None:
+        return await asyncio.shield(existing)
+
+    future: asyncio.Future = asyncio.get_running_loop().create_future()
+    inflight[key] = future
+    try:
+        # Stream the completion: fragments arrive at first-token latency
+        # and the streams of all datasets interleave under asyncio.gather
+        fragments = [
+            fragment
+            async for fragment in api.chat_completions_stream(
+                messages, MODEL, max_completion_tokens=150
+            )
+        ]
+    except BaseException as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved for lone failures
+        raise
+    content = "".join(fragments)
+    future.set_result(content)
+    return content
+
+
+async def process(
+    client: httpx.AsyncClient,
+    api: AsyncAlbertAPI,
+    dataset_id: str,
+    inflight: dict[str, asyncio.Future],
+) -> tuple[str, str, str]:
+    """
+    Fetch one dataset and generate its short description.
+
+    Args:
+        client: Shared data.gouv.fr HTTP client
+        api: Shared Albert API client
+        dataset_id: data.gouv.fr dataset ID
+        inflight: Per-run futures keyed by prompt digest
+
+    Returns:
+        Tuple of (title, description, short description)
+    """
+    title, description, organization_name = await get_dataset_info(
+        client, dataset_id
+    )
+    # Already-short descriptions need no rewriting: skip the LLM round-trip
+    if description and len(description) <= DESCRIPTION_SHORT_MAX_LENGTH:
+        return title, description, description
+    messages = interpolate_prompt(title, description, organization_name)
+    content = await generate_short_description(api, messages, inflight)
+    return title, description, content
+
+
+async def main() -> None:
+    """Generate short descriptions for every dataset in datasets.json."""
+    print("🚀 Albert API Python Playground - Short Description Prompts")
+    print("=" * 60)
+
+    dataset_ids = _read_json(Path(__file__).parent / "datasets.json")
+
+    # One pooled connection per host for the whole run: the data.gouv.fr
+    # fetches and the Albert completions all overlap instead of paying one
+    # TCP+TLS handshake and one full round-trip per dataset.
+    async with datagouv_client() as client, AsyncAlbertAPI() as api:
+        print(f"🤖 Generating {len(dataset_ids)} short descriptions...")
+        inflight: dict[str, asyncio.Future] = {}
+        results = await asyncio.gather(
+            *(
+                process(client, api, dataset_id, inflight)
+                for dataset_id in dataset_ids
+            ),
+            return_exceptions=True,
+        )
+
+    # One buffered write per dataset instead of several small prints, so
+    # each dataset's block hits stdout contiguously in a single syscall
+    for dataset_id, result in zip(dataset_ids, results):
+        lines = ["", "-" * 60]
+        if isinstance(result, BaseException):
+            lines.append(f"❌ {dataset_id}: {result}")
+        else:
+            title, description, content = result
+            lines.append(f"📄 {title}")
+            lines.append(f"Description length: {len(description)}")
+            lines.append(f"✨ Short description: {content}")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    print("\n✅ Short description test completed!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())